@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime
 from typing import (
+    Annotated,
     Any,
     Optional,
     Union,
@@ -14,6 +15,8 @@ from typing import (
     MutableMapping,
 )
 from dataclasses import dataclass
+from enum import Enum
+from http import HTTPStatus
 import json
 
 from todds_typecasting.todds_typecasting import custom_caster, CustomCastingDataclass, auto_cast
@@ -100,6 +103,9 @@ SUCCESS_CASES = [
     # Sequence with tuple input
     (("1", "2", "3"), Sequence[int], [1, 2, 3]),
     ('["1","2"]', Sequence[int], [1, 2]),
+    (b"[1,2,3]", list[int], [1, 2, 3]),
+    (bytearray(b'{"a": "1"}'), dict[str, int], {"a": 1}),
+    (b"false", Union[int, bool], False),
     # --- Tuples (fixed & variadic) ---
     (("1", "2"), tuple[int, int], (1, 2)),
     (["1", "2"], Tuple[int, int], (1, 2)),
@@ -175,6 +181,8 @@ FAILURE_CASES = [
     # Tuple failures
     (("1", "2", "3"), tuple[int, int]),
     (["1", "2", "3"], tuple[int, int]),  # added list causing length mismatch
+    ("[1]", tuple[int, int]),
+    ("[1,2,3]", tuple[int, int]),
     # Mapping failures
     ("not json", dict[str, int]),
     (123, dict[str, int]),
@@ -349,3 +357,246 @@ def test_type_enforcement_cases(value, target, expected, expected_type):
     assert result == expected
     # Critical: ensure the concrete type matches (guards against int vs float vs bool ambiguity)
     assert type(result) is expected_type
+
+
+def test_compiled_casters_are_cached():
+    from todds_typecasting.todds_typecasting import _compile
+
+    assert _compile(dict[str, list[int]]) is _compile(dict[str, list[int]])
+    assert _compile(Optional[int])("7") == 7
+
+
+def test_long_int_lists():
+    values = [str(i) for i in range(100)]
+    result = custom_caster(values, list[int])
+    assert result == list(range(100))
+    assert all(type(v) is int for v in result)
+    # Values outside int64 must still cast exactly
+    big = values + [str(2**70)]
+    assert custom_caster(big, list[int])[-1] == 2**70
+    with pytest.raises(ValueError):
+        custom_caster(values + ["3.14"], list[int])
+
+
+@dataclass
+class _ExtendedConfig(_AppConfig):
+    retries: int = 0
+
+
+def test_dataclass_subclass_builds_own_cast_plan():
+    base = _AppConfig(port="1", debug="no", tags=[], ratios=(), created="2024-01-01T00:00:00")
+    cfg = _ExtendedConfig(port="1", debug="no", tags=[], ratios=(), created="2024-01-01T00:00:00", retries="3")
+    assert (base.port, cfg.port, cfg.retries) == (1, 1, 3)
+    assert "__cast_plan__" in _ExtendedConfig.__dict__
+
+
+@auto_cast
+def _decorated_signature(a: int, /, b: float, *rest, c: list[int] = ("1",), **extra):
+    return a, b, rest, c, extra
+
+
+def test_auto_cast_handles_all_parameter_kinds():
+    assert _decorated_signature("1", "2.5") == (1, 2.5, (), [1], {})
+    assert _decorated_signature("1", b="2", c="[3]", d="x") == (1, 2.0, (), [3], {"d": "x"})
+    assert _decorated_signature("1", "2", "x", "y") == (1, 2.0, ("x", "y"), [1], {})
+
+
+@pytest.mark.parametrize(
+    "value,target",
+    [
+        ([1, 2, 3], list[int]),
+        ((1, 2, 3), tuple[int, ...]),
+        ((1, "a", 2.5), tuple[int, str, float]),
+        ({"a": 1}, dict[str, int]),
+        ({1, 2}, set[int]),
+        (frozenset({"a"}), frozenset[str]),
+    ],
+)
+def test_already_cast_containers_returned_as_is(value, target):
+    assert custom_caster(value, target) is value
+
+
+def test_bool_elements_still_cast_for_int_containers():
+    result = custom_caster([True, 2], list[int])
+    assert result == [1, 2] and type(result[0]) is int
+
+
+def test_dataclass_keeps_already_cast_fields():
+    tags = ["a", "b"]
+    ratios = (1, 2)
+    cfg = _AppConfig(port=1, debug=True, tags=tags, ratios=ratios, created=datetime(2024, 1, 1))
+    assert cfg.tags is tags and cfg.ratios is ratios
+
+
+@dataclass(slots=True)
+class _SlottedConfig(CustomCastingDataclass):
+    port: int
+    flags: list[bool]
+
+
+def test_slotted_dataclass_has_no_instance_dict():
+    cfg = _SlottedConfig(port="80", flags='["yes", "0"]')
+    assert (cfg.port, cfg.flags) == (80, [True, False])
+    assert not hasattr(cfg, "__dict__")
+
+
+@dataclass
+class _HookedConfig(CustomCastingDataclass):
+    port: int
+    label: Any = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.label = f"port-{self.port}"
+
+
+def test_dataclass_user_post_init_runs_after_casting():
+    cfg = _HookedConfig(port="9")
+    assert (cfg.port, cfg.label) == (9, "port-9")
+    assert "self.port = " in _HookedConfig.__post_init_src__
+    assert "self.label" not in _HookedConfig.__post_init_src__
+
+
+def test_auto_cast_casts_bool_for_int():
+    a, flag, nums = _decorated_fn(True, flag=1)
+    assert (a, flag) == (1, True)
+    assert type(a) is int and type(flag) is bool
+
+
+def test_annotated_union_preference():
+    assert type(custom_caster("5", Union[int, float])) is int
+    assert type(custom_caster("5", Annotated[Union[int, float], "prefer=float"])) is float
+    assert custom_caster(None, Annotated[Optional[Union[int, float]], "prefer=float"]) is None
+    assert custom_caster("5", Annotated[int, "doc"]) == 5
+
+
+@dataclass
+class _PreferConfig(CustomCastingDataclass):
+    ratio: Annotated[Union[int, float], "prefer=float"]
+
+
+@auto_cast
+def _decorated_prefer(ratio: Annotated[Union[int, float], "prefer=float"], count: Annotated[int, "doc"] = 0):
+    return ratio, count
+
+
+def test_annotated_preference_dataclass_and_decorator():
+    assert type(_PreferConfig(ratio="2").ratio) is float
+    ratio, count = _decorated_prefer("2", count="3")
+    assert (type(ratio), count) == (float, 3)
+
+
+@pytest.mark.parametrize(
+    "value,target,expected",
+    [
+        ("[123456789012345678901234567890]", list[int], [123456789012345678901234567890]),
+        ("[-9223372036854775809]", list[int], [-9223372036854775809]),
+        (b'{"id": 123456789012345678901}', dict[str, int], {"id": 123456789012345678901}),
+        ("123456789012345678901234567890", Union[int, float], 123456789012345678901234567890),
+    ],
+)
+def test_json_big_ints_stay_exact(value, target, expected):
+    result = custom_caster(value, target)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_json_nan_and_infinity():
+    nan, inf = custom_caster("[NaN, Infinity]", list[float])
+    assert nan != nan and inf == float("inf")
+
+
+class _Color(str, Enum):
+    RED = "red"
+
+
+@dataclass
+class _ColorConfig(CustomCastingDataclass):
+    color: str
+    status: int
+
+
+@auto_cast
+def _decorated_enum(color: str, status: int):
+    return color, status
+
+
+def test_primitive_subclasses_kept():
+    cfg = _ColorConfig(color=_Color.RED, status=HTTPStatus.OK)
+    assert cfg.color is _Color.RED and cfg.status is HTTPStatus.OK
+    assert _decorated_enum(_Color.RED, HTTPStatus.OK) == (_Color.RED, HTTPStatus.OK)
+    assert type(_decorated_enum(_Color.RED, True)[1]) is int
+
+
+@dataclass
+class _UnitConfig(CustomCastingDataclass):
+    timeout: Annotated[int, {"unit": "s"}]
+    samples: list[Annotated[float, {"unit": "ms"}]]
+
+
+@auto_cast
+def _decorated_unit(timeout: Annotated[int, {"unit": "s"}] = "5"):
+    return timeout
+
+
+def test_annotated_unhashable_metadata():
+    assert custom_caster("3", Annotated[int, {"unit": "s"}]) == 3
+    cfg = _UnitConfig(timeout="3", samples=["1.5"])
+    assert (cfg.timeout, cfg.samples) == (3, [1.5])
+    assert _decorated_unit() == 5 and _decorated_unit("7") == 7
+
+
+def test_datetime_parsing_rules():
+    from datetime import timezone, timedelta
+
+    parsed = custom_caster("2024-05-05T10:00:00-05:00", datetime)
+    assert type(parsed.tzinfo) is timezone and parsed.utcoffset() == timedelta(hours=-5)
+    for text in ("2024-01", "2024-01-01T24:00:00"):
+        with pytest.raises(ValueError):
+            custom_caster(text, datetime)
+    assert custom_caster("2024-01", Union[datetime, str]) == "2024-01"
+
+
+def test_fixed_tuple_json_errors():
+    with pytest.raises(ValueError, match="got at most 1"):
+        custom_caster(" [1]", tuple[int, int])
+    with pytest.raises(ValueError, match="got at most 1"):
+        custom_caster(b"[1]", tuple[int, int])
+    for text in ("1", '{"a":1}'):
+        with pytest.raises(TypeError, match="Expected tuple/list"):
+            custom_caster(text, tuple[int, int])
+
+
+def test_union_arm_order_not_shared_between_equal_unions():
+    # Union[str, int] == Union[int, str] in typing; compiled casters must not be shared
+    assert custom_caster(5.0, Union[str, int]) == "5.0"
+    assert custom_caster(5.0, Union[int, str]) == 5
+    assert custom_caster([5.0], list[Union[str, int]]) == ["5.0"]
+    assert custom_caster([5.0], list[Union[int, str]]) == [5]
+
+
+@dataclass
+class _StrFirstConfig(CustomCastingDataclass):
+    x: Union[str, int, None]
+
+
+@dataclass
+class _IntFirstConfig(CustomCastingDataclass):
+    # Flat form: typing's own subscription cache returns the first-built
+    # Optional[Union[...]] object for both nested orders
+    x: Union[int, str, None]
+
+
+def test_optional_union_arm_order_per_class():
+    assert _StrFirstConfig(x=5.0).x == "5.0"
+    assert _IntFirstConfig(x=5.0).x == 5
+
+
+@auto_cast
+def _decorated_positional_only(a: int = "0", /, **kw):
+    return a, kw
+
+
+def test_auto_cast_positional_only_name_in_kwargs():
+    assert _decorated_positional_only("1", a="x") == (1, {"a": "x"})
+    assert _decorated_positional_only(a="x") == (0, {"a": "x"})
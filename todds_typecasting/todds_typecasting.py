@@ -16,6 +16,7 @@ The implementation is intentionally permissive for container protocols
 Supported Features
 ------------------
 - Optional[T] / Union[...] resolution
+- Annotated[Union[...], "prefer=name,..."] to try chosen Union arms first
 - Homogeneous & heterogeneous tuples (Tuple[T, ...] and Tuple[T1, T2, ...])
 - Sequence / Mapping / MutableMapping / Set ABCs
 - Builtins: list, tuple, dict, set, frozenset
@@ -54,10 +55,11 @@ Decorator usage:
 
 import inspect
 import json
+import re
 from dataclasses import dataclass, fields
 from datetime import datetime
-from functools import wraps
-from typing import Any, get_origin, get_args, Union, get_type_hints
+from functools import lru_cache, wraps
+from typing import Annotated, Any, get_origin, get_args, Union, get_type_hints
 from collections.abc import (
     Mapping as AbcMapping,
     MutableMapping as AbcMutableMapping,
@@ -65,11 +67,60 @@ from collections.abc import (
     Set as AbcSet,
 )
 
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:  # orjson is an optional speedup
+    _orjson_loads = None
+
 # ---------- Casting helpers ----------
 
+# Inputs treated as JSON text for container targets
+_JSON_TEXT = (str, bytes, bytearray)
+# orjson decodes integers wider than 64 bits as floats; any text holding a
+# run of 19+ digits is left to the stdlib parser, which keeps them exact
+_LONG_DIGIT_RUN = re.compile(r"\d{19}")
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"\d{19}")
+
+# Element types whose already-cast containers are returned as-is. Checked
+# with `type(x) is t` so bool is never mistaken for int.
+_PRIMITIVES = frozenset({int, float, str, bool})
+
 _CONTAINER_BUILTINS = (list, tuple, dict, set, frozenset)
 _ABCS = (AbcSequence, AbcMapping, AbcMutableMapping, AbcSet)
 
+# Origin dispatch: one dict lookup instead of chained tuple-membership tests
+_LIST, _TUPLE, _DICT, _SET, _FROZENSET, _UNION = range(6)
+_ORIGIN_TAGS = {
+    list: _LIST,
+    AbcSequence: _LIST,
+    tuple: _TUPLE,
+    dict: _DICT,
+    AbcMapping: _DICT,
+    AbcMutableMapping: _DICT,
+    set: _SET,
+    frozenset: _FROZENSET,
+    AbcSet: _SET,
+    Union: _UNION,
+}
+
+
+def _json_loads(text):
+    """
+    Parse JSON text (str, bytes or bytearray).
+
+    Uses orjson when installed, falling back to json.loads for anything orjson
+    rejects (e.g. NaN/Infinity) or could decode lossily (big integers), so
+    results never depend on whether orjson is available.
+    """
+    if _orjson_loads is not None:
+        long_digits = _LONG_DIGIT_RUN if isinstance(text, str) else _LONG_DIGIT_RUN_BYTES
+        if long_digits.search(text) is None:
+            try:
+                return _orjson_loads(text)
+            except ValueError:
+                pass
+    return json.loads(text)
+
 
 def _origin(tp):
     """
@@ -121,66 +172,94 @@ def _unwrap_optional(tp):
     return tp
 
 
-def _isinstance_typing(val, tp) -> bool:
+def _is_primitive(tp) -> bool:
+    """True if tp is one of _PRIMITIVES (safe for unhashable annotations)."""
+    return type(tp) is type and tp in _PRIMITIVES
+
+
+def _all_of_type(items, tp) -> bool:
+    """True if tp is a primitive and every item has exactly that type."""
+    return _is_primitive(tp) and all(type(v) is tp for v in items)
+
+
+def _already_cast(val, tp) -> bool:
     """
-    Lightweight structural instance check respecting typing constructs.
+    Lightweight structural check of a value against a typing annotation.
+
+    Returns
+    -------
+    bool
+        True if the value already satisfies the annotation and can be used
+        unchanged; False if it still needs to go through the caster (casting
+        may still succeed, e.g. from JSON text or a numeric string).
 
     Notes
     -----
-    This does NOT guarantee element type correctness for containers;
-    it only asserts that the outer shape is compatible so we can
-    defer element conversion to custom_caster.
+    Containers of primitives are scanned element-wise (with `type(x) is t`),
+    so an already-cast list[int] is reported as cast. Other parameterized
+    containers report False so custom_caster recurses into their elements.
+    Primitive annotations are checked first. Subclass instances (e.g. str or
+    int enums) are kept as-is; only a bool passed for an int is cast.
     """
+    if _is_primitive(tp):
+        return type(val) is tp or (isinstance(val, tp) and not (tp is int and type(val) is bool))
     if tp is Any:
         return True
 
     o = _origin(tp)
+    tag = _ORIGIN_TAGS.get(o)
 
-    if o is Union:
-        return any(_isinstance_typing(val, t) for t in _targs(tp))
-
-    # For parameterized generics, we purposely return False so that
-    # custom_caster is invoked to recursively cast inner elements.
-    # Only when no type arguments are supplied do we allow a structural True.
+    if tag == _UNION:
+        return any(_already_cast(val, t) for t in _targs(tp))
 
     # Sequence (exclude str/bytes to avoid accidental iteration over chars)
-    if o in (list, AbcSequence):
-        if isinstance(val, (str, bytes, bytearray)):
+    if tag == _LIST:
+        if isinstance(val, (str, bytes, bytearray)) or not isinstance(val, (list, tuple)):
             return False
-        if not isinstance(val, (list, tuple)):
-            return False
-        return len(_targs(tp)) == 0  # unparameterized sequence counts as instance; parameterized forces cast
+        args = _targs(tp)
+        if not args:
+            return True  # unparameterized sequence counts as instance
+        # A tuple is still normalized to a list by custom_caster
+        return isinstance(val, list) and _all_of_type(val, args[0])
 
     # Tuple shape validation (variable-length ellipsis or fixed-length)
-    if o is tuple:
+    if tag == _TUPLE:
         if not isinstance(val, tuple):
             return False
         args = _targs(tp)
-        if len(args) == 0:
+        if not args:
             return True  # unparameterized tuple => any tuple ok
-        # If parameterized, force casting regardless of shape correctness by returning False
-        # but still allow early rejection if gross length mismatch for fixed tuple
         if len(args) == 2 and args[1] is Ellipsis:
-            return False  # cause casting path which will process each element
-        # If fixed-length but length mismatched, fail fast
-        if len(args) != len(val):
-            return False
-        return False  # lengths match but we want casting for element conversion
+            return _all_of_type(val, args[0])
+        return len(args) == len(val) and all(_is_primitive(t) and type(v) is t for v, t in zip(val, args))
 
     # Mapping types
-    if o in (dict, AbcMapping, AbcMutableMapping):
+    if tag == _DICT:
         if not isinstance(val, dict):
             return False
-        return len(_targs(tp)) == 0  # parameterized dict should be cast
+        args = _targs(tp)
+        if not args:
+            return True
+        k_t, v_t = args
+        return _all_of_type(val.keys(), k_t) and _all_of_type(val.values(), v_t)
 
     # Set / frozenset
-    if o in (set, frozenset, AbcSet):
+    if tag == _SET or tag == _FROZENSET:
         if not isinstance(val, (set, frozenset)):
             return False
-        return len(_targs(tp)) == 0  # parameterized set should be cast
+        args = _targs(tp)
+        if not args:
+            return True
+        # Mirrors the concrete type custom_caster would produce
+        ctor = set if o is set or isinstance(val, set) else frozenset
+        return type(val) is ctor and _all_of_type(val, args[0])
 
     # Fallback direct isinstance for concrete classes
-    return isinstance(val, tp) if isinstance(tp, type) else True
+    if isinstance(tp, type):
+        return isinstance(val, tp)
+    if o is Annotated:
+        return _already_cast(val, tp.__origin__)
+    return True
 
 
 def custom_caster(val, target_type):
@@ -210,7 +289,8 @@ def custom_caster(val, target_type):
     Notes
     -----
     - Container elements are cast recursively.
-    - Strings representing JSON arrays/objects are parsed for list/dict/set targets.
+    - Strings (or bytes) representing JSON arrays/objects are parsed for
+      list/tuple/dict/set targets, using orjson when it is installed.
     - Bool casting accepts: true/false, 1/0, t/f, y/n, yes/no (case-insensitive).
     - For Union types, the first successful arm is returned.
 
@@ -224,130 +304,393 @@ def custom_caster(val, target_type):
     >>> custom_caster("3.14", Union[int, float])
     3.14
     """
-    # Fast path: Any or None in Optional
-    if target_type is Any:
+    return _compile(target_type)(val)
+
+
+# Accepted bool string tokens (matched case-insensitively)
+_BOOL_TOKENS = {
+    "true": True,
+    "1": True,
+    "t": True,
+    "y": True,
+    "yes": True,
+    "false": False,
+    "0": False,
+    "f": False,
+    "n": False,
+    "no": False,
+}
+
+
+def _cast_any(val):
+    """Identity caster used for Any and non-class annotations."""
+    return val
+
+
+def _cast_datetime(val):
+    """Cast to datetime, parsing ISO 8601 strings."""
+    return val if isinstance(val, datetime) else datetime.fromisoformat(val)
+
+
+def _cast_bool(val):
+    """Cast to bool with robust string token parsing."""
+    if isinstance(val, bool):
         return val
-    if _is_optional(target_type) and val is None:
-        return None
+    if isinstance(val, (int, float)):
+        return bool(val)
+    if isinstance(val, str):
+        # Exact lowercase tokens hit without allocating a normalized copy
+        result = _BOOL_TOKENS.get(val)
+        if result is None:
+            result = _BOOL_TOKENS.get(val.strip().lower())
+            if result is None:
+                raise ValueError(f"Cannot cast string {val!r} to bool")
+        return result
+    return bool(val)
+
+
+# Precompiled terminal casters. int/float/str map straight to their
+# constructors, so casting a primitive is a single builtin call.
+_LEAF_CASTERS = {
+    Any: _cast_any,
+    int: int,
+    float: float,
+    str: str,
+    bool: _cast_bool,
+    datetime: _cast_datetime,
+}
+
+
+def _compile(target_type):
+    """
+    Compile a typing annotation into a specialized casting function.
+
+    All typing introspection (origin, args, Optional unwrapping) happens once
+    here; the returned closure only performs the per-value work. Nested
+    annotations are compiled recursively, and results are memoized so every
+    annotation is compiled at most once. Unhashable annotations (e.g.
+    Annotated[int, {"unit": "s"}]) are compiled on every call instead.
+
+    Parameters
+    ----------
+    target_type : Any
+        A typing annotation (see custom_caster).
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        Function casting a single value to target_type.
+    """
+    key = _cache_key(target_type)
+    try:
+        hash(key)
+    except TypeError:
+        return _build_caster(target_type)
+    return _build_caster_cached(key, target_type)
+
+
+def _cache_key(tp):
+    """
+    Order-preserving cache key for an annotation.
+
+    typing treats Unions as equal regardless of arm order (Union[int, str] ==
+    Union[str, int]), but arm order decides the casting result, so the key is
+    built recursively from origin and ordered args instead of the annotation.
+    """
+    args = get_args(tp)
+    if not args:
+        return tp
+    return (get_origin(tp), tuple(_cache_key(arg) for arg in args))
+
+
+@lru_cache(maxsize=1024)
+def _build_caster_cached(key, target_type):
+    """Memoized _build_caster for hashable annotations, keyed by _cache_key."""
+    return _build_caster(target_type)
+
+
+def _build_caster(target_type):
+    """Build the casting function for target_type (see _compile)."""
+    # Checked before any lookup that hashes the annotation
+    if get_origin(target_type) is Annotated:
+        return _compile_annotated(target_type)
 
-    tp = _unwrap_optional(target_type)
+    if target_type is Any or type(target_type) is type:
+        leaf = _LEAF_CASTERS.get(target_type)
+        if leaf is not None:
+            return leaf
+
+    # Optional: None passes through, anything else goes to the unwrapped type
+    if _is_optional(target_type):
+        return _nullable(_compile(_unwrap_optional(target_type)))
+
+    tp = target_type
     o = _origin(tp)
+    tag = _ORIGIN_TAGS.get(o)
+
+    if tag == _UNION:
+        return _compile_union(tp)
+    if tag == _LIST:
+        return _compile_sequence(tp)
+    if tag == _TUPLE:
+        return _compile_tuple(tp)
+    if tag == _DICT:
+        return _compile_mapping(tp)
+    if tag == _SET or tag == _FROZENSET:
+        return _compile_set(tp, o)
+
+    # Fallback to constructor for other concrete classes
+    if isinstance(tp, type):
+        return tp
+    return _cast_any
+
+
+def _nullable(cast_inner):
+    """Wrap a caster so that None passes through unchanged (Optional)."""
+
+    def cast_optional(val):
+        return None if val is None else cast_inner(val)
+
+    return cast_optional
+
+
+def _union_preference(metadata):
+    """
+    Extract arm names from a "prefer=name1,name2" Annotated metadata string.
+
+    Returns an empty tuple when no preference is given.
+    """
+    for item in metadata:
+        if isinstance(item, str) and item.startswith("prefer="):
+            return tuple(name.strip() for name in item[len("prefer=") :].split(",") if name.strip())
+    return ()
+
+
+def _compile_annotated(tp):
+    """
+    Compile an Annotated annotation.
 
-    # Union enhanced resolution strategy:
-    # 1. If the runtime value already exactly matches an arm's concrete type, return it unchanged (pass-through).
-    # 2. If value is a string and no arm is str, attempt json.loads(value); if parsed value's exact type matches an arm, return parsed.
-    # 3. Otherwise, attempt casting in declared order returning on first success.
-    if o is Union:
-        arms = _targs(tp)
+    Metadata is ignored except for an optional "prefer=..." string on a Union
+    (or Optional Union), which makes the named arms the first casting
+    attempts, e.g. Annotated[Union[int, datetime], "prefer=datetime"].
+    """
+    base = tp.__origin__
+    prefer = _union_preference(tp.__metadata__)
+    if prefer:
+        inner = _unwrap_optional(base) if _is_optional(base) else base
+        if _origin(inner) is Union:
+            cast_union = _compile_union(inner, prefer)
+            return cast_union if inner is base else _nullable(cast_union)
+    return _compile(base)
+
+
+def _compile_union(tp, prefer=()):
+    """
+    Compile a Union annotation.
+
+    Resolution strategy:
+    1. If the runtime value already exactly matches an arm's concrete type, return it unchanged (pass-through).
+    2. If value is a string and no arm is str, attempt json.loads(value); if parsed value's exact type matches an arm, return parsed.
+    3. Otherwise, attempt casting in declared order returning on first success.
 
+    Arms named in `prefer` (matched by __name__) are attempted in the given
+    order right after step 1, ahead of the JSON heuristic; the remaining arms
+    keep their declared order in step 3.
+    """
+    arms = _targs(tp)
+    preferred = tuple(arm for name in prefer for arm in arms if getattr(arm, "__name__", None) == name)
+    preferred_casters = tuple(_compile(arm) for arm in preferred)
+    arm_casters = tuple(_compile(arm) for arm in arms if arm not in preferred)
+    # Concrete, non-parameterized arms for O(1) exact-type membership
+    concrete_arms = frozenset(arm for arm in arms if isinstance(arm, type))
+    try_json = not any(arm is str for arm in arms)
+
+    def cast_union(val):
         # Step 1: existing exact-type match for concrete, non-parameterized arms.
-        for arm in arms:
-            if isinstance(arm, type) and type(val) is arm:
-                return val
+        if type(val) in concrete_arms:
+            return val
 
-        # Step 2: string -> json.loads heuristic (only if "str" is not among union arms)
-        if isinstance(val, str) and not any((a is str) for a in arms):
+        last_err = None
+        for cast_arm in preferred_casters:
             try:
-                parsed = json.loads(val)
+                return cast_arm(val)
+            except Exception as e:
+                last_err = e
+
+        # Step 2: JSON text -> json.loads heuristic (only if "str" is not among union arms)
+        if try_json and isinstance(val, _JSON_TEXT):
+            try:
+                parsed = _json_loads(val)
             except Exception:
                 parsed = None
-            if parsed is not None:
-                for arm in arms:
-                    # Only accept direct, non-parameterized matches so we don't skip inner element casting.
-                    if isinstance(arm, type) and type(parsed) is arm:
-                        return parsed
+            # Only accept direct, non-parameterized matches so we don't skip inner element casting.
+            if parsed is not None and type(parsed) in concrete_arms:
+                return parsed
 
         # Step 3: ordered attempt (original semantics)
-        last_err = None
-        for arm in arms:
+        for cast_arm in arm_casters:
             try:
-                return custom_caster(val, arm)
+                return cast_arm(val)
             except Exception as e:
                 last_err = e
         raise last_err or TypeError(f"Cannot cast {val!r} to {tp}")
 
-    # Sequence (list / Sequence ABC)
-    # - Accept tuple, but normalize to list
-    # - Reject str to avoid accidental char splitting
-    if o in (list, AbcSequence):
-        (elem_t,) = _targs(tp) or (Any,)
-        if isinstance(val, str):
-            val = json.loads(val)
+    return cast_union
+
+
+def _compile_sequence(tp):
+    """
+    Compile a list / Sequence annotation.
+
+    - Accept tuple, but normalize to list
+    - Reject str to avoid accidental char splitting
+    - Lists whose primitive elements already match are returned unchanged
+    """
+    (elem_t,) = _targs(tp) or (Any,)
+    cast_elem = _compile(elem_t)
+    primitive = _is_primitive(elem_t)
+
+    def cast_sequence(val):
+        if isinstance(val, _JSON_TEXT):
+            val = _json_loads(val)
         if isinstance(val, tuple):
             val = list(val)
         if not isinstance(val, list):
             raise TypeError(f"Expected list/sequence, got {type(val).__name__}")
-        return [custom_caster(v, elem_t) for v in val]
+        if primitive and all(type(v) is elem_t for v in val):
+            return val
+        return [cast_elem(v) for v in val]
 
-    # Tuple (fixed-length or homogeneous with Ellipsis)
-    if o is tuple:
-        args = _targs(tp)
-        if isinstance(val, str):
-            val = json.loads(val)
+    return cast_sequence
+
+
+def _compile_tuple(tp):
+    """
+    Compile a tuple annotation (fixed-length or homogeneous with Ellipsis).
+
+    Tuples whose primitive elements already match are returned unchanged.
+    """
+    args = _targs(tp)
+
+    if len(args) == 2 and args[1] is Ellipsis:
+        elem_t = args[0]
+        cast_elem = _compile(elem_t)
+        primitive = _is_primitive(elem_t)
+
+        def cast_homogeneous_tuple(val):
+            if isinstance(val, _JSON_TEXT):
+                val = _json_loads(val)
+            if not isinstance(val, (list, tuple)):
+                raise TypeError(f"Expected tuple/list, got {type(val).__name__}")
+            if primitive and isinstance(val, tuple) and all(type(v) is elem_t for v in val):
+                return val
+            return tuple(cast_elem(v) for v in val)
+
+        return cast_homogeneous_tuple
+
+    elem_casters = tuple(_compile(t) for t in args)
+    primitive = bool(args) and all(_is_primitive(t) for t in args)
+
+    def cast_fixed_tuple(val):
+        if isinstance(val, _JSON_TEXT):
+            # Cheap reject before parsing: a JSON array holds at most count(",") + 1 items
+            head, comma = ("[", ",") if isinstance(val, str) else (b"[", b",")
+            if val.lstrip().startswith(head):
+                max_items = val.count(comma) + 1
+                if max_items < len(elem_casters):
+                    raise ValueError(f"Tuple length mismatch: expected {len(elem_casters)}, got at most {max_items}")
+            val = _json_loads(val)
         if not isinstance(val, (list, tuple)):
             raise TypeError(f"Expected tuple/list, got {type(val).__name__}")
-        if len(args) == 2 and args[1] is Ellipsis:
-            elem_t = args[0]
-            return tuple(custom_caster(v, elem_t) for v in val)
-        if args and len(args) != len(val):
-            raise ValueError(f"Tuple length mismatch: expected {len(args)}, got {len(val)}")
-        elem_ts = args or (Any,) * len(val)
-        return tuple(custom_caster(v, t) for v, t in zip(val, elem_ts))
-
-    # Mapping (dict / Mapping / MutableMapping)
-    # - Keys and values both cast recursively
-    if o in (dict, AbcMapping, AbcMutableMapping):
-        k_t, v_t = _targs(tp) or (Any, Any)
-        if isinstance(val, str):
-            val = json.loads(val)
-        if not isinstance(val, dict):
-            raise TypeError(f"Expected dict/mapping, got {type(val).__name__}")
-        return {custom_caster(k, k_t): custom_caster(v, v_t) for k, v in val.items()}
-
-    # Sets (set / frozenset / Set ABC)
-    # - Parse from JSON array if given a string
-    # - Preserve chosen concrete type
-    if o in (set, frozenset, AbcSet):
-        (elem_t,) = _targs(tp) or (Any,)
-        if isinstance(val, str):
-            val = json.loads(val)  # expect JSON array
-        if not isinstance(val, (set, frozenset, list, tuple)):
-            raise TypeError(f"Expected set-like, got {type(val).__name__}")
-        seq = list(val) if not isinstance(val, (set, frozenset)) else list(val)
-        casted = [custom_caster(v, elem_t) for v in seq]
-        return set(casted) if o is set or isinstance(val, set) else frozenset(casted)
-
-    # Primitive / special terminals
-    # - datetime from ISO 8601
-    # - dict from JSON if needed
-    # - robust bool token parsing
-    # - fallback to constructor for other concrete classes
-    if tp is datetime:
-        return val if isinstance(val, datetime) else datetime.fromisoformat(val)
-    if tp is dict:
-        return val if isinstance(val, dict) else json.loads(val)
-    if tp is bool:
-        if isinstance(val, bool):
+        if not elem_casters:
+            return tuple(val)
+        if len(elem_casters) != len(val):
+            raise ValueError(f"Tuple length mismatch: expected {len(elem_casters)}, got {len(val)}")
+        if primitive and isinstance(val, tuple) and all(type(v) is t for v, t in zip(val, args)):
             return val
-        if isinstance(val, (int, float)):
-            return bool(val)
-        if isinstance(val, str):
-            s = val.strip().lower()
-            if s in {"true", "1", "t", "y", "yes"}:
-                return True
-            if s in {"false", "0", "f", "n", "no"}:
-                return False
-            raise ValueError(f"Cannot cast string {val!r} to bool")
-        return bool(val)
-    if isinstance(tp, type):
-        return tp(val)
+        return tuple(cast(v) for v, cast in zip(val, elem_casters))
+
+    return cast_fixed_tuple
+
+
+def _ensure_dict(val):
+    """Decode JSON text and validate that the result is a dict."""
+    if isinstance(val, _JSON_TEXT):
+        val = _json_loads(val)
+    if not isinstance(val, dict):
+        raise TypeError(f"Expected dict/mapping, got {type(val).__name__}")
     return val
 
 
+def _compile_mapping(tp):
+    """
+    Compile a dict / Mapping / MutableMapping annotation.
+
+    - Keys and values both cast recursively
+    - Dicts whose primitive keys and values already match are returned unchanged
+    - Any/str keys (the JSON-derived common case) skip the key caster call
+    """
+    k_t, v_t = _targs(tp) or (Any, Any)
+    cast_key = _compile(k_t)
+    cast_value = _compile(v_t)
+    primitive = _is_primitive(k_t) and _is_primitive(v_t)
+
+    if k_t is Any:
+
+        def cast_any_keyed_mapping(val):
+            val = _ensure_dict(val)
+            return {k: cast_value(v) for k, v in val.items()}
+
+        return cast_any_keyed_mapping
+
+    if k_t is str:
+
+        def cast_str_keyed_mapping(val):
+            val = _ensure_dict(val)
+            if primitive and all(type(k) is str and type(v) is v_t for k, v in val.items()):
+                return val
+            return {(k if type(k) is str else str(k)): cast_value(v) for k, v in val.items()}
+
+        return cast_str_keyed_mapping
+
+    def cast_mapping(val):
+        val = _ensure_dict(val)
+        if primitive and all(type(k) is k_t and type(v) is v_t for k, v in val.items()):
+            return val
+        return {cast_key(k): cast_value(v) for k, v in val.items()}
+
+    return cast_mapping
+
+
+def _compile_set(tp, o):
+    """
+    Compile a set / frozenset / Set ABC annotation.
+
+    - Parse from JSON array if given a string
+    - Preserve chosen concrete type
+    - Sets whose primitive elements already match are returned unchanged
+    """
+    (elem_t,) = _targs(tp) or (Any,)
+    cast_elem = _compile(elem_t)
+    primitive = _is_primitive(elem_t)
+
+    def cast_set(val):
+        if isinstance(val, _JSON_TEXT):
+            val = _json_loads(val)  # expect JSON array
+        if not isinstance(val, (set, frozenset, list, tuple)):
+            raise TypeError(f"Expected set-like, got {type(val).__name__}")
+        ctor = set if o is set or isinstance(val, set) else frozenset
+        if primitive and all(type(v) is elem_t for v in val):
+            return val if type(val) is ctor else ctor(val)
+        return ctor(cast_elem(v) for v in val)
+
+    return cast_set
+
+
 # ---------- Dataclass auto-casting ----------
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomCastingDataclass:
     """
     Dataclass mixin that auto-casts fields to their annotated types.
@@ -361,6 +704,9 @@ class CustomCastingDataclass:
     - Uses get_type_hints to resolve postponed annotations and Optional/Union.
     - Skips casting when a value already matches structurally (performance).
     - Nested containers are handled recursively.
+    - The mixin itself defines empty __slots__, so subclasses declared with
+      @dataclass(slots=True) carry no per-instance __dict__. This is
+      recommended for classes instantiated at high rates.
 
     Examples
     --------
@@ -386,16 +732,54 @@ class CustomCastingDataclass:
         -----
         - Uses typing.get_type_hints to robustly handle Optional/Union and
           postponed annotations.
+        - Type hints and compiled casters are resolved once per class (see
+          _dataclass_cast_plan) and reused by every later instance.
         - Only attempts casting if structural type check fails.
         """
-        type_hints = get_type_hints(self.__class__)
-        for f in fields(self):
-            target = type_hints.get(f.name, Any)
-            current = getattr(self, f.name)
-            # Skip if already correct type
-            if not _isinstance_typing(current, target):
-                casted = custom_caster(current, target)
-                setattr(self, f.name, casted)
+        cls = type(self)
+        cast_fields = cls.__dict__.get("__cast_plan__")
+        if cast_fields is None:
+            cast_fields = _dataclass_cast_plan(cls)
+        cast_fields(self)
+
+
+def _dataclass_cast_plan(cls):
+    """
+    Generate and store the per-class field casting function.
+
+    The function body is generated source with one straight-line block per
+    field. Each block reads the field, skips it if _already_cast reports it
+    is already cast, and otherwise assigns the compiled caster's result.
+    Fields annotated as Any are omitted. The source is kept on
+    cls.__post_init_src__ for debugging.
+
+    The function is built lazily on first instantiation rather than in
+    __init_subclass__, because the @dataclass decorator (and therefore
+    fields()) only runs after the class body has been created. Looking it up
+    in cls.__dict__ keeps subclasses from reusing a parent's function, and a
+    user-defined __post_init__ calling super() is left intact.
+    """
+    type_hints = get_type_hints(cls, include_extras=True)
+    namespace = {"_already_cast": _already_cast}
+    lines = ["def __cast_fields__(self):"]
+    for i, f in enumerate(fields(cls)):
+        target = type_hints.get(f.name, Any)
+        if target is Any:
+            continue
+        namespace[f"_t{i}"] = target
+        namespace[f"_c{i}"] = _compile(target)
+        lines += [
+            f"    value = self.{f.name}",
+            f"    if not _already_cast(value, _t{i}):",
+            f"        self.{f.name} = _c{i}(value)",
+        ]
+    lines.append("    return None")
+    src = "\n".join(lines) + "\n"
+    exec(src, namespace)
+    cast_fields = namespace["__cast_fields__"]
+    cls.__cast_plan__ = cast_fields
+    cls.__post_init_src__ = src
+    return cast_fields
 
 
 # ---------- Function decorator (args + kwargs) ----------
@@ -417,7 +801,8 @@ def auto_cast(func):
 
     Notes
     -----
-    - Default parameter values are included (bind + apply_defaults).
+    - Default parameter values are cast too, as if passed explicitly.
+    - The signature is inspected once; calls do no inspect work.
     - Only casts when the current value fails a structural check.
     - Useful for CLI / JSON / environment variable ingestion.
 
@@ -430,23 +815,61 @@ def auto_cast(func):
     (5, True)
     """
     sig = inspect.signature(func)
-    type_hints = {
-        name: param.annotation for name, param in sig.parameters.items() if param.annotation is not inspect._empty
+    # Binding plan, resolved once at decoration time: (annotation, caster) per
+    # annotated named parameter, looked up by name or by position.
+    params = [
+        p for p in sig.parameters.values() if p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    ]
+    plan = {p.name: (p.annotation, _compile(p.annotation)) for p in params if p.annotation is not inspect._empty}
+    positional = tuple(
+        plan.get(p.name)
+        for p in params
+        if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    )
+    # Positional-only names passed as keywords belong to **kwargs, not the parameter
+    keyword_plan = {
+        name: entry
+        for name, entry in plan.items()
+        if sig.parameters[name].kind is not inspect.Parameter.POSITIONAL_ONLY
     }
+    # Defaults that fail the structural check get cast on every call, exactly
+    # like explicit arguments. Positional-only defaults are always listed so
+    # they can be appended in order.
+    defaults = []
+    for index, p in enumerate(params):
+        if p.default is inspect._empty:
+            continue
+        if p.kind is inspect.Parameter.KEYWORD_ONLY:
+            index = None  # can never be filled positionally
+        positional_only = p.kind is inspect.Parameter.POSITIONAL_ONLY
+        entry = plan.get(p.name)
+        cast = entry[1] if entry is not None and not _already_cast(p.default, entry[0]) else None
+        if cast is not None or positional_only:
+            defaults.append((index, p.name, p.default, cast, positional_only))
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # Bind positional & keyword arguments respecting signature defaults
-        bound = sig.bind_partial(*args, **kwargs)  # captures both args & kwargs
-        bound.apply_defaults()  # include defaults so everything is present
-
-        for name, value in list(bound.arguments.items()):
-            expected = type_hints.get(name, Any)
+        args = list(args)
+        for i, (value, entry) in enumerate(zip(args, positional)):
             # Only cast when necessary
-            if not _isinstance_typing(value, expected):
-                bound.arguments[name] = custom_caster(value, expected)
+            if entry is not None and not _already_cast(value, entry[0]):
+                args[i] = entry[1](value)
+
+        for name, value in kwargs.items():
+            entry = keyword_plan.get(name)
+            if entry is not None and not _already_cast(value, entry[0]):
+                kwargs[name] = entry[1](value)
+
+        for index, name, default, cast, positional_only in defaults:
+            if (index is not None and index < len(args)) or (not positional_only and name in kwargs):
+                continue
+            value = default if cast is None else cast(default)
+            if not positional_only:
+                kwargs[name] = value
+            elif index == len(args):
+                args.append(value)
 
         # Call original function with casted arguments
-        return func(*bound.args, **bound.kwargs)
+        return func(*args, **kwargs)
 
     return wrapper